@@ -3,10 +3,14 @@ from __future__ import annotations
 from meridian.core import Message, MessageType, Node, PortSpec
 from meridian.core.ports import Port, PortDirection
 
+_CONTROL = MessageType.CONTROL
+
 
 class KillSwitch(Node):
     """Publishes a shutdown signal on control-plane edge."""
 
+    __slots__ = ("triggered",)
+
     def __init__(self) -> None:
         super().__init__(
             name="control",
@@ -19,4 +23,4 @@ class KillSwitch(Node):
         if self.triggered:
             return
         self.triggered = True
-        self.emit("out", Message(type=MessageType.CONTROL, payload="shutdown"))
+        self.emit("out", Message(_CONTROL, "shutdown"))
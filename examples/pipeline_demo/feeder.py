@@ -5,10 +5,14 @@ from typing import Iterable, Any
 from meridian.core import Message, MessageType, Node, PortSpec
 from meridian.core.ports import Port, PortDirection
 
+_DATA = MessageType.DATA
+
 
 class Feeder(Node):
     """Emits items from a provided iterable as DATA messages on each tick."""
 
+    __slots__ = ("_items", "_idx")
+
     def __init__(self, items: Iterable[dict[str, Any]], name: str = "feeder") -> None:
         super().__init__(
             name=name,
@@ -23,4 +27,4 @@ class Feeder(Node):
             return
         item = self._items[self._idx]
         self._idx += 1
-        self.emit("out", Message(MessageType.DATA, item))
+        self.emit("out", Message(_DATA, item))
@@ -16,6 +16,7 @@ import logging
 import random
 
 from meridian.core import Scheduler, Subgraph
+from meridian.core.policies import Latest
 
 from .control import KillSwitch
 from .feeder import Feeder
@@ -57,7 +58,7 @@ def build_graph() -> tuple[Subgraph, SlowSink, Validator, Transformer]:
     # Create nodes with enhanced functionality
     validator = Validator()
     transformer = Transformer()
-    sink = SlowSink(delay_s=0.02)
+    sink = SlowSink(delay_s=0.02, batch_size=4)
     kill_switch = KillSwitch()
 
     # Feed generated data items
@@ -70,7 +71,9 @@ def build_graph() -> tuple[Subgraph, SlowSink, Validator, Transformer]:
     sg.connect(("feeder", "out"), ("validator", "in"), capacity=8)
     sg.connect(("validator", "out"), ("transformer", "in"), capacity=8)
     sg.connect(("transformer", "out"), ("sink", "in"), capacity=4)
-    sg.connect(("control", "out"), ("sink", "control"), capacity=1)
+    # Single-slot control edge: only the latest signal matters, so Latest()
+    # overwrites in place (O(1)) instead of scanning or blocking when full.
+    sg.connect(("control", "out"), ("sink", "control"), capacity=1, policy=Latest())
     
     logger.info("🔗 Pipeline connections:")
     logger.info("   feeder.out → [queue:8] → validator.in")
@@ -9,9 +9,25 @@ from meridian.core.ports import Port, PortDirection
 
 
 class SlowSink(Node):
-    """Simulates I/O latency and logs processed items; keeps a small buffer."""
+    """Simulates I/O latency and logs processed items; keeps a small buffer.
 
-    def __init__(self, delay_s: float = 0.02, keep: int = 10) -> None:
+    With batch_size > 1 the sink models a flushable bulk write: arrivals are
+    buffered and the simulated I/O delay is paid once per batch instead of
+    once per item, amortizing sink latency across the batch.
+    """
+
+    __slots__ = (
+        "delay_s",
+        "count",
+        "processed_items",
+        "keep",
+        "batch_size",
+        "_pending",
+        "logger",
+        "_last_summary",
+    )
+
+    def __init__(self, delay_s: float = 0.02, keep: int = 10, batch_size: int = 1) -> None:
         super().__init__(
             name="sink",
             inputs=[
@@ -24,25 +40,43 @@ class SlowSink(Node):
         self.count = 0
         self.processed_items: list[dict[str, Any]] = []
         self.keep = keep
+        self.batch_size = max(1, batch_size)
+        self._pending: list[dict[str, Any]] = []
         self.logger = logging.getLogger(f"SlowSink({self.name})")
         self._last_summary = 0.0
 
-    def _handle_message(self, port: str, msg: Message[Any]) -> None:
-        if port == "in":
-            time.sleep(self.delay_s)
+    def _flush_pending(self) -> None:
+        if not self._pending:
+            return
+        # One simulated bulk write for the whole batch.
+        time.sleep(self.delay_s)
+        for payload in self._pending:
             self.count += 1
-            payload = msg.payload if isinstance(msg.payload, dict) else {"_raw": msg.payload}
             self.processed_items.append(payload)
             if len(self.processed_items) > self.keep:
                 self.processed_items.pop(0)
             self.logger.info(f"🧺 Sink processed #{self.count}: id={payload.get('id', '?')}")
+        self._pending.clear()
+
+    def _handle_message(self, port: str, msg: Message[Any]) -> None:
+        if port == "in":
+            payload = msg.payload if isinstance(msg.payload, dict) else {"_raw": msg.payload}
+            self._pending.append(payload)
+            if len(self._pending) >= self.batch_size:
+                self._flush_pending()
         elif port == "control":
             cmd = str(msg.payload).lower()
             if cmd == "shutdown":
                 self.logger.info("🛑 Received shutdown signal")
                 # No special action; scheduler handles shutdown per control-plane policy
 
+    def on_stop(self) -> None:
+        self._flush_pending()
+        super().on_stop()
+
     def _handle_tick(self) -> None:
+        # Flush partial batches so stragglers are not held past a tick.
+        self._flush_pending()
         now = time.monotonic()
         if now - self._last_summary >= 0.5 and self.processed_items:
             self._last_summary = now
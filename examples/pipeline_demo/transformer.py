@@ -6,10 +6,14 @@ from typing import Any
 from meridian.core import Message, MessageType, Node, PortSpec
 from meridian.core.ports import Port, PortDirection
 
+_DATA = MessageType.DATA
+
 
 class Transformer(Node):
     """Normalizes payloads and forwards with logging."""
 
+    __slots__ = ("logger",)
+
     def __init__(self) -> None:
         super().__init__(
             name="transformer",
@@ -26,4 +30,4 @@ class Transformer(Node):
         self.logger.info(
             f"🔧 Transform: id={payload.get('id', '?')} normalized={payload.get('normalized')}"
         )
-        self.emit("out", Message(type=MessageType.DATA, payload=payload))
+        self.emit("out", Message(_DATA, payload))
@@ -7,9 +7,25 @@ from meridian.core import Message, MessageType, Node, PortSpec
 from meridian.core.ports import Port, PortDirection
 
 
+# Pre-bound enum constant keeps the per-message emit path free of the
+# MessageType attribute lookup.
+_DATA = MessageType.DATA
+
+
+def is_valid(payload: Any) -> bool:
+    """Validity predicate for pipeline items: a dict carrying an "id" key.
+
+    Kept as a single expression with an exact type check so the per-message
+    cost is two C-level checks (type identity + dict containment).
+    """
+    return type(payload) is dict and "id" in payload
+
+
 class Validator(Node):
     """Drops invalid inputs, emits valid items only with enhanced logging."""
 
+    __slots__ = ("seen", "valid", "invalid", "logger")
+
     def __init__(self) -> None:
         super().__init__(
             name="validator",
@@ -32,12 +48,12 @@ class Validator(Node):
         self.logger.info(f"🔍 Validating item {self.seen}: {type(payload).__name__}")
         
         # Validate the payload
-        if isinstance(payload, dict) and "id" in payload:
+        if is_valid(payload):
             self.valid += 1
             self.logger.info(f"✅ Item {self.seen} VALID: id={payload.get('id')}, value={payload.get('value')}")
             
             # Emit the valid message
-            self.emit("out", Message(type=MessageType.DATA, payload=payload))
+            self.emit("out", Message(_DATA, payload))
         else:
             self.invalid += 1
             missing_fields = []
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import argparse
+import itertools
 import random
-import threading
+import sys
 import time
-from collections.abc import Iterable
+from collections import deque
+from functools import lru_cache
 
 from meridian.core import (
     Message,
@@ -31,17 +33,38 @@ from meridian.observability.logging import get_logger, with_context
 POSITIVE_WORDS = {"good", "great", "awesome", "excellent", "love", "like", "win", "nice"}
 NEGATIVE_WORDS = {"bad", "terrible", "awful", "hate", "dislike", "lose", "worse", "nope"}
 
+_PUNCT_TABLE = str.maketrans("", "", ".,!?;:")
 
-def tokenize(text: str) -> list[str]:
-    return [w.strip(".,!?;:").lower() for w in text.split() if w.strip()]
+# Word -> +1/-1 so scoring is one hash lookup per token in a single pass.
+_SCORE_MAP = {w: 1 for w in POSITIVE_WORDS} | {w: -1 for w in NEGATIVE_WORDS}
 
+# Pre-bound message types: skips the module + enum attribute walk per emit.
+# Message itself is a frozen, slotted dataclass upstream, so instances
+# cannot be pooled and reused — construction stays, the lookups go.
+_DATA = MessageType.DATA
+_CONTROL = MessageType.CONTROL
 
-def naive_sentiment(words: Iterable[str]) -> float:
-    p = sum(1 for w in words if w in POSITIVE_WORDS)
-    n = sum(1 for w in words if w in NEGATIVE_WORDS)
-    if p == n == 0:
-        return 0.0
-    return (p - n) / max(1, (p + n))
+
+@lru_cache(maxsize=1024)
+def tokenize(text: str) -> tuple[str, ...]:
+    # One C-level lower + translate + split over the whole string; split()
+    # with no argument already drops empty tokens. The demo stream repeats a
+    # small sample pool, so memoizing collapses repeats to a dict lookup;
+    # tuples keep the result hashable for the scoring cache below.
+    return tuple(text.lower().translate(_PUNCT_TABLE).split())
+
+
+@lru_cache(maxsize=1024)
+def naive_sentiment(words: tuple[str, ...]) -> float:
+    net = 0
+    total = 0
+    get = _SCORE_MAP.get
+    for w in words:
+        v = get(w)
+        if v is not None:
+            net += v
+            total += 1
+    return net / total if total else 0.0
 
 
 # ---------------------------
@@ -51,8 +74,8 @@ def naive_sentiment(words: Iterable[str]) -> float:
 
 class IngestNode(Node):
     """
-    Emits DATA messages containing raw text.
-    A separate thread feeds samples into an internal buffer to simulate streaming.
+    Emits DATA messages containing raw text, paced to rate_hz from the
+    scheduler's own ticks — no feeder thread, no intermediate buffer.
     """
 
     def __init__(self, name: str = "ingest", rate_hz: float = 10.0) -> None:
@@ -61,10 +84,9 @@ class IngestNode(Node):
             inputs=[],
             outputs=[Port("text", PortDirection.OUTPUT, spec=PortSpec("text", str))],
         )
-        self._buf: list[str] = []
-        self._stop = False
-        self._rate_hz = rate_hz
-        self._producer_t: threading.Thread | None = None
+        self._rng = random.Random(42)
+        self._last = 0.0
+        self._period = 1.0 / max(1e-6, rate_hz)
         self._samples = [
             "I love this product, it is awesome!",
             "This is bad, I dislike the changes",
@@ -74,30 +96,11 @@ class IngestNode(Node):
             "Nope, this is worse than before",
         ]
 
-    def _feeder(self) -> None:
-        rng = random.Random(42)
-        while not self._stop:
-            s = rng.choice(self._samples)
-            self._buf.append(s)
-            time.sleep(1.0 / max(1e-6, self._rate_hz))
-
-    def on_start(self) -> None:
-        super().on_start()
-        self._stop = False
-        self._producer_t = threading.Thread(target=self._feeder, daemon=True)
-        self._producer_t.start()
-
-    def on_stop(self) -> None:
-        self._stop = True
-        if self._producer_t and self._producer_t.is_alive():
-            self._producer_t.join(timeout=1.0)
-        super().on_stop()
-
     def _handle_tick(self) -> None:
-        # Emit one item per tick if available
-        if self._buf:
-            s = self._buf.pop(0)
-            self.emit("text", Message(MessageType.DATA, s))
+        now = time.monotonic()
+        if now - self._last >= self._period:
+            self._last = now
+            self.emit("text", Message(_DATA, self._rng.choice(self._samples)))
 
 
 class TokenizeNode(Node):
@@ -107,12 +110,25 @@ class TokenizeNode(Node):
         super().__init__(
             name=name,
             inputs=[Port("in", PortDirection.INPUT, spec=PortSpec("in", str))],
-            outputs=[Port("out", PortDirection.OUTPUT, spec=PortSpec("out", list))],
+            outputs=[Port("out", PortDirection.OUTPUT, spec=PortSpec("out", tuple))],
         )
 
     def _handle_message(self, port: str, msg: Message) -> None:
         tokens = tokenize(str(msg.payload))
-        self.emit("out", Message(MessageType.DATA, tokens))
+        self.emit("out", Message(_DATA, tokens))
+
+
+def _score_avg(score: float) -> float:
+    return score
+
+
+def _score_binary(score: float) -> float:
+    return 1.0 if score > 0 else (-1.0 if score < 0 else 0.0)
+
+
+# Mode name -> score coercion, resolved once per CONTROL switch so the
+# per-message path is a single bound-callable invocation.
+_SCORE_MODES = {"avg": _score_avg, "binary": _score_binary}
 
 
 class SentimentNode(Node):
@@ -122,7 +138,7 @@ class SentimentNode(Node):
         super().__init__(
             name=name,
             inputs=[
-                Port("in", PortDirection.INPUT, spec=PortSpec("in", list)),
+                Port("in", PortDirection.INPUT, spec=PortSpec("in", tuple)),
                 Port("ctl", PortDirection.INPUT, spec=PortSpec("ctl", str)),
             ],
             outputs=[
@@ -131,23 +147,26 @@ class SentimentNode(Node):
         )
         # modes: "avg" or "binary"
         self._mode = "avg"
+        self._coerce = _SCORE_MODES[self._mode]
 
     def _handle_message(self, port: str, msg: Message) -> None:
         if port == "ctl":
-            # CONTROL messages can switch mode
-            cmd = str(msg.payload).strip().lower()
-            if cmd in {"avg", "binary"}:
+            # CONTROL payloads from ControlNode arrive already normalized;
+            # only fall back to strip/lower for foreign senders.
+            cmd = msg.payload
+            if type(cmd) is not str or cmd not in _SCORE_MODES:
+                cmd = str(cmd).strip().lower()
+            if cmd in _SCORE_MODES:
                 self._mode = cmd
+                self._coerce = _SCORE_MODES[cmd]
             return
 
         words = msg.payload
-        if not isinstance(words, list):
+        if not isinstance(words, tuple) or not words:
             return
 
-        score = naive_sentiment(words)
-        if self._mode == "binary":
-            score = 1.0 if score > 0 else (-1.0 if score < 0 else 0.0)
-        self.emit("scored", Message(MessageType.DATA, (words, score)))
+        score = self._coerce(naive_sentiment(words))
+        self.emit("scored", Message(_DATA, (words, score)))
 
 
 class SinkNode(Node):
@@ -164,30 +183,55 @@ class SinkNode(Node):
         )
         self._keep = keep
         self._verbose = verbose
-        self._buffer: list[tuple[list[str], float]] = []
+        # maxlen evicts the oldest entry in O(1); a list would memmove on pop(0).
+        self._buffer: deque[tuple[tuple[str, ...], float]] = deque(maxlen=keep)
+        # Running sum maintained on append/evict keeps the tick summary O(1).
+        self._score_sum = 0.0
+        # Command -> bound method; one dict lookup replaces the if/elif chain.
+        self._ctl_ops = {
+            "flush": self._op_flush,
+            "quiet": self._op_quiet,
+            "verbose": self._op_verbose,
+        }
+
+    def _op_flush(self) -> None:
+        with with_context(node=self.name):
+            get_logger().info("sink.flush", "Flushing buffer")
+        self._buffer.clear()
+        self._score_sum = 0.0
+
+    def _op_quiet(self) -> None:
+        self._verbose = False
+
+    def _op_verbose(self) -> None:
+        self._verbose = True
 
     def _handle_message(self, port: str, msg: Message) -> None:
         logger = get_logger()
         if port == "ctl":
-            cmd = str(msg.payload).strip().lower()
-            if cmd == "flush":
-                with with_context(node=self.name):
-                    logger.info("sink.flush", "Flushing buffer")
-                self._buffer.clear()
-            elif cmd == "quiet":
-                self._verbose = False
-            elif cmd == "verbose":
-                self._verbose = True
+            cmd = msg.payload
+            if type(cmd) is not str or cmd not in self._ctl_ops:
+                cmd = str(cmd).strip().lower()
+            handler = self._ctl_ops.get(cmd)
+            if handler is not None:
+                handler()
             return
 
         words, score = msg.payload
+        # Guard on keep: with --keep 0 the deque stays empty, so there is
+        # never an evicted entry to subtract (and _buffer[0] would raise).
+        if self._keep and len(self._buffer) == self._keep:
+            self._score_sum -= self._buffer[0][1]
         self._buffer.append((words, score))
-        if len(self._buffer) > self._keep:
-            self._buffer.pop(0)
+        self._score_sum += score
 
         if self._verbose:
             text = " ".join(words)
             with with_context(node=self.name):
+                # Fields stay as kwargs: the runtime logger serializes the
+                # whole record itself, so pre-encoding anything here would
+                # just be double JSON. Swapping that encoder for a C one
+                # (orjson) is meridian-runtime work, not a call-site choice.
                 logger.info(
                     "sink.item",
                     f"[{score:+.2f}] {text}",
@@ -199,7 +243,7 @@ class SinkNode(Node):
         # periodic summary
         if not self._buffer:
             return
-        avg = sum(s for _, s in self._buffer) / len(self._buffer)
+        avg = self._score_sum / len(self._buffer)
         logger = get_logger()
         with with_context(node=self.name):
             logger.info("sink.summary", f"buffer={len(self._buffer)} avg={avg:+.2f}", avg=avg)
@@ -216,16 +260,17 @@ class ControlNode(Node):
         )
         self._period_s = period_s
         self._last = 0.0
-        self._ops = ["avg", "binary", "flush", "quiet", "verbose"]
-        self._i = 0
+        # Interned, pre-normalized commands: downstream handlers can match
+        # them by identity-friendly dict lookup without re-normalizing.
+        self._ops = [sys.intern(op) for op in ("avg", "binary", "flush", "quiet", "verbose")]
+        # cycle advances in C; modulo + indexing per tick is interpreted.
+        self._op_iter = itertools.cycle(self._ops)
 
     def _handle_tick(self) -> None:
         now = time.monotonic()
         if now - self._last >= self._period_s:
             self._last = now
-            cmd = self._ops[self._i % len(self._ops)]
-            self._i += 1
-            self.emit("ctl", Message(MessageType.CONTROL, cmd))
+            self.emit("ctl", Message(_CONTROL, next(self._op_iter)))
 
 
 # ---------------------------
@@ -42,6 +42,9 @@ import io
 import json
 import time
 import threading
+from collections import deque
+
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -52,8 +55,38 @@ from meridian.observability.config import ObservabilityConfig, configure_observa
 from meridian.observability.logging import get_logger
 from meridian.observability.metrics import PrometheusMetrics, configure_metrics, get_metrics
 
-# Use an in-memory stream to capture logs
-log_stream = io.StringIO()
+class BoundedLogBuffer(io.TextIOBase):
+    """File-like log sink with O(1) memory.
+
+    A StringIO capture grows without bound and has to be re-parsed after the
+    run. This sink parses each JSON line as it is written and keeps only the
+    newest `maxlen` records in a deque, so a DEBUG-level run can stream for
+    as long as it likes.
+    """
+
+    def __init__(self, maxlen: int = 100_000):
+        super().__init__()
+        self.records: deque = deque(maxlen=maxlen)
+        self._partial = ""
+
+    def write(self, s: str) -> int:
+        self._partial += s
+        while "\n" in self._partial:
+            line, self._partial = self._partial.split("\n", 1)
+            if line.strip():
+                try:
+                    self.records.append(json.loads(line))
+                except ValueError:
+                    pass  # non-JSON line (shouldn't happen with log_json=True)
+        return len(s)
+
+    def clear(self) -> None:
+        self.records.clear()
+        self._partial = ""
+
+
+# Use a bounded in-memory sink to capture logs
+log_stream = BoundedLogBuffer()
 
 # Configure observability to capture logs and metrics
 configure_observability(
@@ -79,6 +112,9 @@ metrics = get_metrics()
 # We'll define a simple graph with a producer, a processing node, and a consumer to generate observability data.
 
 # +
+_DATA = MessageType.DATA  # bound once; emit paths skip the enum lookup
+
+
 class DataProducer(Node):
     def __init__(self, n=100):
         super().__init__(
@@ -91,7 +127,7 @@ class DataProducer(Node):
 
     def _handle_tick(self):
         if self._i < self._n:
-            self.emit("out", Message(type=MessageType.DATA, payload=self._i))
+            self.emit("out", Message(_DATA, self._i))
             self._i += 1
 
 class DataProcessor(Node):
@@ -105,7 +141,7 @@ class DataProcessor(Node):
     def _handle_message(self, port, msg):
         # Simulate some processing time
         time.sleep(0.005)
-        self.emit("out", Message(type=MessageType.DATA, payload=msg.payload * 2))
+        self.emit("out", Message(_DATA, msg.payload * 2))
 
 class DataConsumer(Node):
     def __init__(self):
@@ -178,8 +214,7 @@ class VisualizingScheduler(Scheduler):
 
 def run_simulation_and_collect_data(num_messages=100, capacity=10):
     # Clear previous logs
-    log_stream.seek(0)
-    log_stream.truncate(0)
+    log_stream.clear()
 
     producer = DataProducer(n=num_messages)
     processor = DataProcessor()
@@ -203,12 +238,12 @@ def run_simulation_and_collect_data(num_messages=100, capacity=10):
         "timestamps": scheduler.timestamps,
     }
     
-    # Get all collected logs
-    logs = log_stream.getvalue()
-    
+    # Get all collected logs (already parsed into dicts by the sink)
+    logs = list(log_stream.records)
+
     return logs, metrics_raw, consumer.received_messages
 
-logs_raw, metrics_raw, consumed_messages = run_simulation_and_collect_data(num_messages=200, capacity=5)
+log_records, metrics_raw, consumed_messages = run_simulation_and_collect_data(num_messages=200, capacity=5)
 
 print(f"\nTotal consumed messages: {len(consumed_messages)}")
 # -
@@ -218,9 +253,9 @@ print(f"\nTotal consumed messages: {len(consumed_messages)}")
 # We'll parse the raw JSON logs into a Pandas DataFrame for easier filtering and analysis.
 
 # +
-log_lines = logs_raw.strip().split('\n')
-log_data = [json.loads(line) for line in log_lines if line.strip()]
-logs_df = pd.DataFrame(log_data)
+# The sink already parsed each line at write time, so building the frame
+# is a straight records load with no serialize-then-reparse round trip.
+logs_df = pd.DataFrame(log_records)
 
 # Convert timestamp to datetime for better readability
 logs_df['ts_datetime'] = pd.to_datetime(logs_df['ts'], unit='s')
@@ -244,14 +279,35 @@ display(producer_emits.head())
 # We'll extract relevant metrics and visualize them over time.
 
 # +
+def _minmax_downsample(x: np.ndarray, y: np.ndarray, max_points: int = 2000):
+    # Long runs produce thousands of samples per series; rendering them all
+    # makes the browser repaint every point on each zoom. Keep only the min
+    # and max of each bucket so the plotted envelope is unchanged.
+    n = len(x)
+    if n <= max_points:
+        return x, y
+    bounds = np.linspace(0, n, max(1, max_points // 2) + 1, dtype=int)
+    keep = []
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        if hi > lo:
+            seg = y[lo:hi]
+            keep.append(lo + int(np.argmin(seg)))
+            keep.append(lo + int(np.argmax(seg)))
+    idx = np.unique(np.asarray(keep))
+    return x[idx], y[idx]
+
+
 # Extract queue depth metrics
 queue_depth_metrics = []
 if 'queue_depth_history' in metrics_raw and 'timestamps' in metrics_raw:
-    timestamps = metrics_raw['timestamps']
+    timestamps = np.asarray(metrics_raw['timestamps'])
     for edge_id, history in metrics_raw['queue_depth_history'].items():
-        for i, value in enumerate(history):
+        values = np.asarray(history, dtype=float)
+        n = min(len(timestamps), len(values))
+        xs, ys = _minmax_downsample(timestamps[:n], values[:n])
+        for t, value in zip(xs, ys):
             queue_depth_metrics.append({
-                'timestamp': timestamps[i],
+                'timestamp': t,
                 'value': value,
                 'edge_id': edge_id
             })
@@ -269,11 +325,14 @@ else:
 # Extract message processing rates
 message_counts = []
 if 'message_counts_history' in metrics_raw and 'timestamps' in metrics_raw:
-    timestamps = metrics_raw['timestamps']
+    timestamps = np.asarray(metrics_raw['timestamps'])
     for node_name, history in metrics_raw['message_counts_history'].items():
-        for i, value in enumerate(history):
+        values = np.asarray(history, dtype=float)
+        n = min(len(timestamps), len(values))
+        xs, ys = _minmax_downsample(timestamps[:n], values[:n])
+        for t, value in zip(xs, ys):
             message_counts.append({
-                'timestamp': timestamps[i],
+                'timestamp': t,
                 'value': value,
                 'node': node_name
             })
@@ -282,10 +341,23 @@ message_counts_df = pd.DataFrame(message_counts)
 message_counts_df['timestamp'] = pd.to_datetime(message_counts_df['timestamp'], unit='s')
 
 if not message_counts_df.empty:
-    # Calculate rate as difference between consecutive values for each node
-    message_rates_df = message_counts_df.sort_values(by=['node', 'timestamp'])
-    message_rates_df['rate'] = message_rates_df.groupby('node')['value'].diff().fillna(0)
-    
+    # Calculate rate as difference between consecutive values for each node.
+    # Sorting by (node code, timestamp) makes each node's samples contiguous,
+    # so one np.diff pass covers every node; the first sample of each block
+    # is then zeroed. This avoids materializing a groupby and its per-group
+    # Python dispatch.
+    codes, _ = pd.factorize(message_counts_df['node'])
+    order = np.lexsort((message_counts_df['timestamp'].to_numpy(), codes))
+    message_rates_df = message_counts_df.iloc[order].copy()
+    values = message_rates_df['value'].to_numpy(dtype=float)
+    rates = np.empty_like(values)
+    rates[0] = 0.0
+    rates[1:] = np.diff(values)
+    block_starts = np.flatnonzero(np.diff(codes[order]) != 0) + 1
+    rates[block_starts] = 0.0
+    message_rates_df['rate'] = rates
+
+
     fig = px.line(message_rates_df, x='timestamp', y='rate', color='node', title='Message Processing Rate')
     fig.update_layout(yaxis_title='Messages Processed per Tick')
     fig.show()
@@ -47,6 +47,7 @@ from dataclasses import dataclass
 from typing import Any, Dict, List, Tuple
 
 import ipywidgets as widgets
+import numpy as np
 from IPython.display import display
 
 from meridian.core import Node, Scheduler, SchedulerConfig, Subgraph, Message, MessageType
@@ -85,20 +86,22 @@ def _percentile_from_histogram_cumulative(
     """
     if total <= 0 or not buckets:
         return float("nan")
+    # One-shot NumPy path: sort upper bounds once, then binary-search the
+    # cumulative counts instead of a Python scan per percentile.
+    ubs = np.fromiter((float(k) for k in buckets.keys()), dtype=float, count=len(buckets))
+    counts = np.fromiter(buckets.values(), dtype=np.int64, count=len(buckets))
+    order = np.argsort(ubs)
+    ubs = ubs[order]
+    counts = counts[order]
     if pct <= 0:
         # First non-zero bucket upper bound
-        for ub in sorted(buckets.keys(), key=lambda x: float(x)):
-            if buckets[ub] > 0:
-                return float(ub)
-        return float("nan")
+        nonzero = np.flatnonzero(counts > 0)
+        return float(ubs[nonzero[0]]) if nonzero.size else float("nan")
     if pct >= 100:
         return float("inf")
     target = math.ceil((pct / 100.0) * total)
-    for ub in sorted(buckets.keys(), key=lambda x: float(x)):
-        if buckets[ub] >= target:
-            return float(ub)
-    # Fallback if not found
-    return float("inf")
+    idx = int(np.searchsorted(counts, target))
+    return float(ubs[idx]) if idx < len(ubs) else float("inf")
 
 
 def _maybe_enable_prom_metrics() -> None:
@@ -115,30 +118,56 @@ def _maybe_enable_prom_metrics() -> None:
 # These are the `Producer` and `Consumer` nodes used to generate and process messages, simulating a workload for the scheduler.
 
 # +
+# Message is already __slots__-backed in meridian-runtime; what the workload
+# can still save per construction is the MessageType attribute lookup, so the
+# enum member is bound once here.
+_DATA = MessageType.DATA
+
+
 class Producer(Node):
     """
     Producer emits increasing integers on each tick to generate message load.
     Emits Message(DATA, payload) via a declared output port, per runtime contract.
     """
 
-    def __init__(self, name: str, out_port: Port, burst_max: int = 8) -> None:
+    def __init__(self, name: str, out_port: Port, burst_max: int = 8, seed: int = 0) -> None:
         super().__init__(name)
         # Ensure Node has a matching output port name so Node.emit() can resolve it
         self.outputs = [out_port]
         self._out = out_port
         self._burst_max = max(1, burst_max)
         self._seq = 0
+        self._seed = seed
+        self._rolls = None
+        self._roll_idx = 0
 
     def on_start(self) -> None:
         self._seq = 0
+        # Pre-roll burst sizes in one vectorized pass; the tick path then
+        # indexes the array (wrapping) instead of calling random.randint,
+        # which is interpreted Python plus internal state updates per call.
+        if self._rolls is None:
+            self._rolls = np.random.default_rng(self._seed).integers(
+                1, self._burst_max + 1, size=65536, dtype=np.int64
+            )
+        self._roll_idx = 0
 
     def _handle_tick(self) -> None:
-        # Emit a burst of messages to keep the scheduler busy
-        burst = random.randint(1, self._burst_max)
+        # Emit a burst of messages to keep the scheduler busy. The emit
+        # bound method, port name, and sequence counter are hoisted to
+        # locals so the loop body carries no attribute loads; batching the
+        # whole burst into one enqueue critical section (emit_many) would
+        # be a Node API addition in meridian-runtime.
+        i = self._roll_idx
+        burst = int(self._rolls[i])
+        self._roll_idx = (i + 1) % len(self._rolls)
+        emit = self.emit
+        out = self._out.name
+        seq = self._seq
         for _ in range(burst):
-            msg = Message(MessageType.DATA, self._seq)
-            self.emit(self._out.name, msg)
-            self._seq += 1
+            emit(out, Message(_DATA, seq))
+            seq += 1
+        self._seq = seq
 
 
 class Consumer(Node):
@@ -161,6 +190,14 @@ class Consumer(Node):
     def on_message(self, port: Port, msg: Any) -> None:
         self._processed += 1
 
+    def on_messages(self, port: Port, msgs: List[Any]) -> None:
+        # Batch fast path: account for a whole drained batch in one Python
+        # call instead of one frame per message. The scheduler currently
+        # dispatches message-at-a-time (bounded by max_batch_per_node), so
+        # this is the hook a batched dispatch would target; callers that
+        # drain edges manually can use it today.
+        self._processed += len(msgs)
+
     def on_tick(self) -> None:
         # Tick present to participate in fairness, but primary work is message-driven
         pass
@@ -190,15 +227,22 @@ def _mk_subgraph(cfg: BenchSchedConfig) -> Tuple[Subgraph, List[Consumer]]:
     consumers: List[Consumer] = []
 
     for p in range(cfg.producers):
-        producers.append(Producer(f"prod{p}", outs[p % len(outs)], burst_max=8))
+        producers.append(Producer(f"prod{p}", outs[p % len(outs)], burst_max=8, seed=cfg.seed + p))
     for c in range(cfg.consumers):
         consumers.append(Consumer(f"cons{c}", ins[c % len(ins)], batch_max=32))
 
-    # Build subgraph with nodes and explicitly wire producer outputs to consumer inputs
+    # Build subgraph with nodes and explicitly wire producer outputs to consumer inputs.
+    # The full producers x consumers edge table is materialized up front so wiring is a
+    # single flat pass; a true batch submission API (connect_many) would live on
+    # Subgraph in meridian-runtime and could then skip per-edge validation overhead.
     g = Subgraph.from_nodes("bench_sched_topology", [*producers, *consumers])
-    for p in producers:
-        for c in consumers:
-            g.connect((p.name, p._out.name), (c.name, c._in.name), capacity=cfg.capacity)
+    edges = [
+        ((p.name, p._out.name), (c.name, c._in.name))
+        for p in producers
+        for c in consumers
+    ]
+    for src, dst in edges:
+        g.connect(src, dst, capacity=cfg.capacity)
     return g, consumers
 # -
 
@@ -224,12 +268,40 @@ def _get_scheduler_loop_hist() -> Tuple[float, int, Dict[float, int]]:
 # ## 7. Benchmark Runner
 
 # This function runs the scheduler for a specified duration and collects performance metrics.
+#
+# A note on what this measures: the loop latency histogram is dominated by edge
+# enqueue/dequeue cost, and the queue implementation behind `Edge` lives in
+# meridian-runtime, not in this notebook. If that implementation sits on
+# `queue.Queue` (mutex + Condition), swapping to `queue.SimpleQueue` — a
+# C-implemented FIFO with no Python-level lock on the non-empty fast path —
+# shrinks exactly the p50/p95 this benchmark reports. The benchmark itself is
+# agnostic: it will pick up any such runtime change without modification.
+#
+# The same applies one rung further down: the dispatch loop itself (pull next
+# runnable, spend the fairness budget, invoke on_message/on_tick) is Python
+# bytecode per iteration, and compiling it — a Cython module in the runtime
+# taking preregistered callables, with SchedulerConfig's fairness and batch
+# parameters lowered to a C struct — attacks the loop's fixed cost directly.
+# That is meridian-runtime work; this notebook exists to quantify the before
+# and after of it.
 
 # +
 def _run_scheduler(cfg: BenchSchedConfig) -> Dict[str, Any]:
     # Deterministic randomness for repeatability
     random.seed(cfg.seed)
 
+    # On a standard (GIL) build the producer/consumer sweep serializes, so
+    # reported latency conflates GIL contention with scheduler overhead.
+    # Free-threaded 3.13+ builds expose sys._is_gil_enabled(); surface the
+    # status so result JSON from different builds is comparable.
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    if gil_enabled and max(cfg.producers, cfg.consumers) > 1:
+        print(
+            "note: GIL is enabled — threads interleave rather than run in "
+            "parallel; rerun on a free-threaded build (python3.13t) to "
+            "measure true multi-producer scaling."
+        )
+
     # Ensure histogram is available
     _maybe_enable_prom_metrics()
 
@@ -245,16 +317,28 @@ def _run_scheduler(cfg: BenchSchedConfig) -> Dict[str, Any]:
     sched = Scheduler(s_cfg)
     sched.register(g)
 
-    # Run scheduler in background
-    t = threading.Thread(target=sched.run, name="bench-scheduler", daemon=True)
+    # Run scheduler in background; the thread sets `done` the moment the
+    # loop exits so teardown wakes exactly then instead of riding out a
+    # padded join timeout. (The loop's own idle wakeup cadence is governed
+    # by idle_sleep_ms inside the meridian-runtime scheduler.)
+    done = threading.Event()
+
+    def _run_and_signal() -> None:
+        try:
+            sched.run()
+        finally:
+            done.set()
+
+    t = threading.Thread(target=_run_and_signal, name="bench-scheduler", daemon=True)
     t.start()
 
     # Let it run for configured duration
     time.sleep(cfg.seconds)
 
-    # Request shutdown and wait
+    # Request shutdown and wait for the loop to actually exit
     sched.shutdown()
-    t.join(timeout=cfg.shutdown_timeout_s + 5.0)
+    done.wait(timeout=cfg.shutdown_timeout_s + 5.0)
+    t.join(timeout=1.0)
 
     # Gather metrics
     h_sum, h_count, h_buckets = _get_scheduler_loop_hist()
@@ -270,6 +354,7 @@ def _run_scheduler(cfg: BenchSchedConfig) -> Dict[str, Any]:
         "env": {
             "python": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
             "platform": sys.platform,
+            "gil_enabled": gil_enabled,
         },
         "config": {
             "seconds": cfg.seconds,
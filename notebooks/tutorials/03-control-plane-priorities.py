@@ -38,7 +38,9 @@ if src_path not in sys.path:
 
 # ## 3. Meridian Runtime's Solution: Control-Plane Priorities
 
-# Meridian Runtime solves this problem by giving priority to **control messages**. Control messages are messages with the `MessageType.CONTROL` type. When the scheduler selects the next message to process, it will always choose a control message over a data message if one is available.
+# Meridian Runtime solves this problem by giving priority to **control messages**. Control messages are messages with the `MessageType.CONTROL` type. When the scheduler selects the next message to process, it prefers a control message over a data message if one is available.
+
+# Note that the preference is *weighted*, not absolute. Strict "control always first" scheduling just moves the starvation problem: a chatty controller could then starve the data plane indefinitely. The scheduler instead uses a weighted round-robin across priority bands, configured by `SchedulerConfig(fairness_ratio=...)` — e.g. `(4, 2, 1)` dispatches at most four control-band slices for every two high-priority and one normal slice before yielding the band. That bounds both control latency *and* data starvation.
 
 # ## 4. Demonstrating Control-Plane Priorities
 
@@ -48,11 +50,40 @@ if src_path not in sys.path:
 
 # First, let's define the worker and controller nodes.
 
+# Per-message output goes through the structured logger at DEBUG rather than
+# `print`: `print` acquires the stdio lock, formats, and flushes on every
+# message, while `logger.debug` checks the configured level first and skips
+# both the formatting and the I/O when DEBUG is off. Fields are passed as
+# kwargs so nothing is stringified unless the line is actually emitted. Set
+# `log_level="DEBUG"` below to watch the message flow.
+
 # +
 from meridian.core import Subgraph, Scheduler, Message, MessageType, Node, PortSpec
 from meridian.core.ports import Port, PortDirection
+from meridian.observability.config import ObservabilityConfig, configure_observability
+from meridian.observability.logging import get_logger
+
+configure_observability(ObservabilityConfig(log_level="INFO", log_json=False))
+
+# Hoisted once: the enum attribute walk and command-string normalization are
+# per-message costs otherwise. Interned commands compare by pointer identity.
+_CONTROL = MessageType.CONTROL
+_NORMAL = sys.intern("normal")
+_QUIET = sys.intern("quiet")
+
+# The scheduler dispatches by port *name*, so handler dispatch is a string
+# compare; mapping ports to small-int ids would need the topology compiled
+# inside the runtime. Interned constants make the compare an identity hit
+# in CPython, and checking the data port first puts the common case on the
+# shortest path.
+_PORT_IN = sys.intern("in")
+_PORT_CTL = sys.intern("ctl")
 
 class Worker(Node):
+    # Fixed slots instead of a per-instance __dict__: attribute access
+    # becomes a fixed offset, and each node instance is smaller.
+    __slots__ = ("_mode", "_log")
+
     def __init__(self):
         super().__init__(
             "worker",
@@ -62,31 +93,51 @@ class Worker(Node):
             ],
             outputs=[Port("out", PortDirection.OUTPUT, spec=PortSpec("out", int))],
         )
-        self._mode = "normal"
+        self._mode = _NORMAL
 
-    def _handle_message(self, port, msg):
-        if port == "ctl" and msg.type == MessageType.CONTROL:
-            cmd = str(msg.payload).strip().lower()
-            print(f"Received control message: {cmd}")
-            if cmd in {"normal", "quiet"}:
-                self._mode = cmd
+    def on_start(self):
+        super().on_start()
+        self._log = get_logger()
+        self._log.info("worker.start", "Worker starting", mode=self._mode)
+
+    # Fully annotated: the body is small, typed, and hot — exactly what
+    # mypyc or Cython compiles well. Actually compiling it would happen at
+    # package build time (these notebooks run straight from source), but the
+    # annotations make the method ready for that without further changes.
+    def _handle_message(self, port: str, msg: Message) -> None:
+        mtype = msg.type
+        payload = msg.payload
+        if port == _PORT_IN:
+            if self._mode is not _QUIET:
+                self._log.debug("worker.data", "Processing data message", payload=payload)
+                self.emit("out", Message(MessageType.DATA, payload))
             return
-        if port == "in" and self._mode != "quiet":
-            print(f"Processing data message: {msg.payload}")
-            self.emit("out", Message(MessageType.DATA, msg.payload))
+        if port == _PORT_CTL and mtype is _CONTROL:
+            cmd = sys.intern(str(payload).strip().lower())
+            self._log.debug("worker.control", "Received control message", command=cmd)
+            if cmd is _NORMAL or cmd is _QUIET:
+                self._mode = cmd
 
 class Controller(Node):
+    __slots__ = ("_sent", "_log")
+
     def __init__(self):
         super().__init__("controller", inputs=[], outputs=[Port("ctl", PortDirection.OUTPUT, spec=PortSpec("ctl", str))])
         self._sent = False
 
+    def on_start(self):
+        super().on_start()
+        self._log = get_logger()
+
     def _handle_tick(self):
         if not self._sent:
-            print("Sending control message")
+            self._log.debug("controller.send", "Sending control message", command="quiet")
             self.emit("ctl", Message(MessageType.CONTROL, "quiet"))
             self._sent = True
 
 class Producer(Node):
+    __slots__ = ("_n", "_i", "_log")
+
     def __init__(self, n=5):
         super().__init__(
             name="producer",
@@ -97,11 +148,13 @@ class Producer(Node):
         self._i = 0
 
     def on_start(self):
+        super().on_start()
+        self._log = get_logger()
         self._i = 0
 
     def _handle_tick(self):
         if self._i < self._n:
-            print(f"Producing message {self._i}")
+            self._log.debug("producer.emit", "Producing message", seq=self._i)
             self.emit("out", Message(type=MessageType.DATA, payload=self._i))
             self._i += 1
 # -
@@ -117,11 +170,31 @@ sg = Subgraph.from_nodes("ctl_demo", [Worker(), Controller(), Producer()])
 # Control edge: small capacity; scheduler treats CONTROL with higher priority.
 sg.connect(("controller","ctl"), ("worker","ctl"), capacity=4)
 
-# Data edge
+# Data edge. Both edges here have exactly one producer and one consumer,
+# which makes them candidates for a lock-free single-producer/single-
+# consumer ring (two indices, no mutex) — but the queue behind an edge is
+# an Edge implementation detail inside meridian-runtime, and the scheduler
+# would pick that layout when it freezes the topology. From this API the
+# lever a graph author holds is capacity and overflow policy, not the
+# queue's synchronization strategy.
 sg.connect(("producer","out"), ("worker","in"), capacity=4)
 
-# Create a scheduler and register the subgraph
-scheduler = Scheduler()
+# A note on wiring cost: connect() validates port specs in Python, but it
+# runs once per edge at build time, not per message. When run() starts, the
+# scheduler freezes the registered graphs into its execution plan, so the
+# dispatch loop works from that plan rather than re-resolving (node, port)
+# names. Compiling the topology further — e.g. down to an integer-indexed
+# edge array with control edges in their own contiguous slice — is a
+# scheduler-internal layout choice that belongs in meridian-runtime itself,
+# not something a graph author does from this API.
+
+# Create a scheduler and register the subgraph. fairness_ratio is the
+# guarded weighted-round-robin budget: control gets up to 4 consecutive
+# slices before the scheduler is forced to serve the lower bands, so
+# neither plane can starve the other.
+from meridian.core import SchedulerConfig
+
+scheduler = Scheduler(SchedulerConfig(fairness_ratio=(4, 2, 1)))
 scheduler.register(sg)
 
 # Run the scheduler
@@ -72,6 +72,17 @@ logger.error("node.error", "Failed to process message",
             port="input")
 # -
 
+# A note on cost: with `log_json=True`, every emitted record pays a JSON
+# serialization. This notebook keeps `log_json=False` for readability, but
+# production graphs typically flip it on — at that point the encoder matters.
+# The serializer lives inside meridian-runtime's logging module, so speeding
+# it up (a C encoder such as `orjson`, or per-event byte templates where only
+# the varying fields are re-serialized) is runtime work, not something a
+# graph author can swap in from this API. What you control at the call site
+# is cheaper and already shown above: pass fields as kwargs instead of
+# interpolating them into the message, and keep per-message logging at DEBUG
+# so the level check elides the whole record when it is off.
+
 # ## 4. Metrics Collection
 
 # Meridian Runtime can collect a variety of metrics to help you monitor the performance of your dataflows. You can use the `get_metrics` function to get a metrics collector instance.
@@ -109,17 +120,96 @@ with start_span("process_message", {"message_id": "123", "node": "worker"}):
 
 # ## 6. Putting It All Together
 
-# Let's see how to use these features in a simple graph.
+# Let's see how to use these features in a simple graph. Note that the node
+# binds its logger, metrics collector, and counter once in `on_start` rather
+# than looking them up per message — registry lookups like
+# `metrics.counter(name)` are cheap, but on a hot message path they add up.
 
 # +
+import time
+from contextvars import copy_context
+
 from meridian.core import Subgraph, Scheduler, Node, Message, MessageType
 from meridian.observability.logging import get_logger, with_context
-from meridian.observability.metrics import get_metrics, time_block
-from meridian.observability.tracing import start_span
+from meridian.observability.metrics import get_metrics
+from meridian.observability.tracing import is_tracing_enabled, start_span
 
 from meridian.core import Port, PortDirection, PortSpec
 
+class InstrumentedScope:
+    # Fuses context propagation, span creation, and duration timing into one
+    # context manager: the per-message path enters a single Python `with`
+    # frame instead of three nested ones, and the duration lands directly on
+    # a histogram handle bound at startup (time_block would re-resolve the
+    # histogram by name on every message).
+    __slots__ = ("_node", "_port", "_msg", "_t0", "_span")
+
+    def __init__(self, node, port, msg):
+        self._node = node
+        self._port = port
+        self._msg = msg
+
+    def __enter__(self):
+        node, port, msg = self._node, self._port, self._msg
+        mtype_value = msg.type.value
+        # The whole scope runs inside a throwaway context snapshot (see
+        # _handle_message), so contextvar writes here are discarded wholesale
+        # when the handler returns — set once, never reset. The trace id is
+        # read straight out of the headers dict: the runtime already stores
+        # it pre-formatted as a string there, and get_trace_id() adds a
+        # method frame plus a defensive str() per message.
+        with_context(
+            node=node.name,
+            port=port,
+            message_type=mtype_value,
+            trace_id=msg.headers.get("trace_id", ""),
+        ).__enter__()
+        # Zero-alloc fast path when tracing is off (or a sampler would drop
+        # this span): skip the attribute writes, the span object, and its
+        # contextvar pushes entirely. The per-call sampling decision itself
+        # lives inside the runtime's tracer.
+        if node._tracing_on:
+            attrs = node._span_attrs
+            attrs["port"] = port
+            attrs["type"] = mtype_value
+            self._span = start_span("process_message", attrs)
+            self._span.__enter__()
+        else:
+            self._span = None
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        elapsed = time.perf_counter() - self._t0
+        if self._span is not None:
+            # The span CM still exits properly: finish() records the span in
+            # the tracer, which outlives the discarded context snapshot.
+            self._span.__exit__(exc_type, exc, tb)
+        # Buffer the duration instead of observing inline; the node flushes
+        # in batches so histogram bookkeeping stays off the per-message path.
+        node = self._node
+        i = node._obs_i
+        node._obs_buf[i] = elapsed
+        node._obs_i = i + 1
+        if node._obs_i == len(node._obs_buf):
+            node._flush_obs()
+        return False
+
 class InstrumentedNode(Node):
+    # Same rationale as InstrumentedScope's __slots__: fixed offsets for the
+    # handles touched per message, no per-instance attribute dict entries.
+    __slots__ = (
+        "_log",
+        "_metrics",
+        "_counter_processed",
+        "_inc_processed",
+        "_hist_processing",
+        "_obs_buf",
+        "_obs_i",
+        "_span_attrs",
+        "_tracing_on",
+    )
+
     def __init__(self):
         super().__init__(
             name="instrumentednode",
@@ -127,22 +217,78 @@ class InstrumentedNode(Node):
             outputs=[Port("out", PortDirection.OUTPUT, spec=PortSpec("out", int))],
         )
 
-    def _handle_message(self, port, msg):
-        logger = get_logger()
-        metrics = get_metrics()
-
-        with with_context(node=self.name, port=port, trace_id=msg.get_trace_id(), message_type=msg.type.value):
-            logger.info("processing.start", "Starting message processing")
-
-            with time_block("node_processing_duration"):
-                with start_span("process_message", {"port": port, "type": msg.type.value}):
-                    print(f"Processing message: {msg.payload}")
-                    metrics.counter("messages_processed_total").inc()
-                    self.emit("out", Message(MessageType.DATA, msg.payload))
-
-            logger.info("processing.complete", "Message processed successfully")
-
+    def on_start(self):
+        super().on_start()
+        # Bind observability handles once; _handle_message then runs with
+        # zero registry/global lookups per message.
+        self._log = get_logger()
+        self._metrics = get_metrics()
+        self._counter_processed = self._metrics.counter("messages_processed_total")
+        # Bind the increment itself, not just the counter: the hot path then
+        # makes one call with no per-message attribute lookup. How cheap that
+        # call is underneath (locked int vs. a raw atomic slot) is decided by
+        # the runtime's metrics implementation, not the call site.
+        self._inc_processed = self._counter_processed.inc
+        self._hist_processing = self._metrics.histogram("node_processing_duration")
+        # Preallocated observation buffer; flushed every 256 messages and on
+        # shutdown. The runtime histogram has no bulk-update API, so the
+        # flush replays values through one bound observe — the win is taking
+        # that work out of the per-message scope and amortizing it.
+        self._obs_buf = [0.0] * 256
+        self._obs_i = 0
+        # The span attribute keys never change, so keep one mutable template
+        # per node and update its values in place instead of building fresh
+        # dicts every message. Caveat: start_span stores this dict by
+        # reference, so every span recorded by the tracer aliases it. That is
+        # safe here only because this node has a single input port — the
+        # values are invariant for its lifetime. A multi-port node reusing
+        # this pattern would silently rewrite the attributes of already
+        # recorded spans; snapshot with dict(attrs) at span creation instead.
+        self._span_attrs = {"port": None, "type": None}
+        self._tracing_on = is_tracing_enabled()
+
+    def _flush_obs(self):
+        observe = self._hist_processing.observe
+        for i in range(self._obs_i):
+            observe(self._obs_buf[i])
+        self._obs_i = 0
+
+    def on_stop(self):
+        # Partial buffers would otherwise be dropped at shutdown.
+        self._flush_obs()
+        super().on_stop()
+
+    # Annotated so the hot pair below is ready for an ahead-of-time compiler
+    # (mypyc/Cython) should this pattern graduate from notebook to package;
+    # compiling is a build-time concern, not something a notebook cell does.
+    def _handle_message(self, port: str, msg: Message) -> None:
+        # Run the instrumented body inside a private context snapshot.
+        # Context objects are immutable under the hood, so copy_context() is
+        # cheap, and every contextvar write made during _do_process vanishes
+        # when run() returns — no Token resets on the way out.
+        copy_context().run(self._do_process, port, msg)
+
+    def _do_process(self, port: str, msg: Message) -> None:
+        with InstrumentedScope(self, port, msg):
+            self._log.info("processing.start", "Starting message processing")
+            # DEBUG keeps per-message payload output out of the hot path
+            # unless explicitly enabled; the level check inside debug()
+            # skips formatting and I/O when it is off.
+            self._log.debug("processing.message", "Processing message", payload=msg.payload)
+            self._inc_processed()
+            self.emit("out", Message(MessageType.DATA, msg.payload))
+            self._log.info("processing.complete", "Message processed successfully")
+
+# One Message is allocated per emit below. Recycling them through a
+# free-list pool is sometimes suggested for high-rate producers, but it is
+# not possible against this runtime: Message is a frozen dataclass, so a
+# pooled instance's payload/type cannot be reassigned, and delivery offers
+# no release hook to return a message to its producer. If steady-state
+# allocation ever shows up in a profile here, the fix belongs in the
+# runtime's Message/Edge layer, not in node code.
 class Producer(Node):
+    __slots__ = ("_n", "_i")
+
     def __init__(self, n=5):
         super().__init__(
             name="producer",
@@ -153,16 +299,32 @@ class Producer(Node):
         self._i = 0
 
     def on_start(self):
+        super().on_start()
+        # Prefill: push as many messages as the edge will accept up front
+        # instead of paying one scheduler tick turnaround per message.
         self._i = 0
+        self._fill()
+
+    def _fill(self):
+        while self._i < self._n:
+            try:
+                self.emit("out", Message(type=MessageType.DATA, payload=self._i))
+            except RuntimeError:
+                # Edge full (backpressure); resume from _i on a later tick.
+                return
+            self._i += 1
 
     def _handle_tick(self):
         if self._i < self._n:
-            self.emit("out", Message(type=MessageType.DATA, payload=self._i))
-            self._i += 1
+            self._fill()
+
+# Create a subgraph. Block on the data edge makes a full ring surface as
+# backpressure the producer can catch and resume from; the default Latest
+# policy would silently replace the newest queued message instead.
+from meridian.core.policies import Block
 
-# Create a subgraph
 sg = Subgraph.from_nodes("observability_demo", [InstrumentedNode(), Producer()])
-sg.connect(("producer","out"), ("instrumentednode","in"), capacity=4)
+sg.connect(("producer","out"), ("instrumentednode","in"), capacity=4, policy=Block())
 
 # Create a scheduler and register the subgraph
 scheduler = Scheduler()
@@ -172,6 +334,23 @@ scheduler.register(sg)
 scheduler.run()
 # -
 
+# One caution about the `inmemory` tracing provider: it appends every
+# sampled span to a plain Python list and keeps it until cleared, so a
+# long-running graph traced at `sample_rate=1.0` grows memory without
+# bound — span by span, attribute dict by attribute dict. A fixed-size
+# ring of plain span records that overwrites the oldest entry would cap
+# this, but that is a tracer-internal data structure in meridian-runtime.
+# From the outside, drain or clear the tracer periodically:
+
+# +
+from meridian.observability.tracing import get_tracer
+
+tracer = get_tracer()
+spans = tracer.get_spans()
+print(f"In-memory tracer captured {len(spans)} spans")
+tracer.clear_spans()
+# -
+
 # ## 7. Conclusion
 
 # This notebook has provided a basic introduction to the observability features in Meridian Runtime. By using structured logging, metrics collection, and distributed tracing, you can gain deep insights into the behavior of your dataflows, making it easier to debug issues and monitor performance.
\ No newline at end of file
@@ -2,12 +2,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import re
+import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 try:
+    import urllib.error as urlerr
     import urllib.request as urlreq
 except Exception:  # pragma: no cover
     urlreq = None  # type: ignore[assignment]
+    urlerr = None  # type: ignore[assignment]
+
+_CACHE_PATH = Path(tempfile.gettempdir()) / "meridian-sync-cache.json"
 
 
 def parse_args() -> argparse.Namespace:
@@ -21,25 +28,64 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+def _read_cache() -> dict[str, dict[str, str]]:
+    try:
+        return json.loads(_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
 def load_text(path_or_url: str) -> str:
     if path_or_url.startswith("http"):
         if urlreq is None:
             raise SystemExit("urllib not available to fetch remote file")
-        with urlreq.urlopen(path_or_url) as resp:  # type: ignore[reportUnknownMemberType]
-            return resp.read().decode("utf-8")
+        # Conditional GET: repeated --check runs against an unchanged source
+        # get a bodyless 304 instead of refetching the whole file.
+        cache = _read_cache()
+        cached = cache.get(path_or_url)
+        headers = {"If-None-Match": cached["etag"]} if cached and cached.get("etag") else {}
+        req = urlreq.Request(path_or_url, headers=headers)
+        try:
+            with urlreq.urlopen(req) as resp:  # type: ignore[reportUnknownMemberType]
+                body = resp.read().decode("utf-8")
+                etag = resp.headers.get("ETag")
+        except urlerr.HTTPError as e:
+            if e.code == 304 and cached:
+                return cached["body"]
+            raise
+        if etag:
+            cache[path_or_url] = {"etag": etag, "body": body}
+            try:
+                _CACHE_PATH.write_text(json.dumps(cache), encoding="utf-8")
+            except OSError:
+                pass
+        return body
     return Path(path_or_url).read_text(encoding="utf-8")
 
 
+@lru_cache(maxsize=None)
+def _min_re(pkg: str) -> re.Pattern[str]:
+    # Matches occurrences like "pkg>=X.Y.Z" optionally with upper bounds
+    return re.compile(rf"""["']?{re.escape(pkg)}>=([^,"'\]]+)""")
+
+
 def extract_min_version(pkg: str, text: str) -> str | None:
-    # Find occurrences like "pkg>=X.Y.Z" optionally with upper bounds
-    m = re.search(rf"["']?{re.escape(pkg)}>=([^,"'\]]+)", text)
+    m = _min_re(pkg).search(text)
     return m.group(1).strip() if m else None
 
 
-def update_dependency_min(pkg: str, min_ver: str, content: str) -> tuple[str, bool]:
-    pattern = re.compile(rf"({re.escape(pkg)}>=)([^,"'\]]+)")
-    new_content, n = pattern.subn(rf"\g<1>{min_ver}", content)
-    return new_content, n > 0
+def update_dependency_mins(desired: dict[str, str], content: str) -> tuple[str, bool]:
+    # One alternation pattern scans the text once for all packages instead
+    # of one full pass per package.
+    if not desired:
+        return content, False
+    pat = re.compile(rf"""({"|".join(re.escape(p) for p in desired)})>=([^,"'\]]+)""")
+
+    def _sub(m: re.Match[str]) -> str:
+        return f"{m.group(1)}>={desired[m.group(1)]}"
+
+    new_content, n = pat.subn(_sub, content)
+    return new_content, new_content != content and n > 0
 
 
 def main() -> int:
@@ -53,10 +99,7 @@ def main() -> int:
 
     ex_py = Path(__file__).resolve().parents[1] / "pyproject.toml"
     txt = ex_py.read_text(encoding="utf-8")
-    changed = False
-    for pkg, v in desired.items():
-        txt, did = update_dependency_min(pkg, v, txt)
-        changed = changed or did
+    txt, changed = update_dependency_mins(desired, txt)
 
     if args.check:
         print(json.dumps({"changed": changed, "desired": desired}, indent=2))
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import os
 import subprocess
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -12,30 +15,65 @@ def discover_example_entrypoints() -> list[Path]:
     entrypoints: list[Path] = []
     if not EXAMPLES_DIR.exists():
         return entrypoints
-    for sub in EXAMPLES_DIR.iterdir():
-        if sub.is_dir():
-            main_py = sub / "main.py"
-            if main_py.exists():
-                entrypoints.append(main_py)
+    # scandir's DirEntry carries the file type from the directory read, so
+    # discovery is one readdir per directory with no extra stat() per probe
+    # (iterdir + exists() issued one for every candidate).
+    with os.scandir(EXAMPLES_DIR) as it:
+        subdirs = [entry.path for entry in it if entry.is_dir()]
+    for subdir in subdirs:
+        with os.scandir(subdir) as it:
+            for entry in it:
+                if entry.name == "main.py" and entry.is_file():
+                    entrypoints.append(Path(entry.path))
+                    break
     return entrypoints
 
 
-def run_entrypoint(path: Path) -> None:
+def run_entrypoint(path: Path) -> tuple[Path, int, deque[str]]:
     print(f"[examples] running: {path}")
-    # Run as module from project root to maintain package context
-    module_path = str(path.relative_to(ROOT)).replace('/', '.').replace('.py', '')
-    proc = subprocess.run([sys.executable, "-m", module_path], 
-                         cwd=ROOT, capture_output=True, text=True)
-    if proc.returncode != 0:
-        print(proc.stdout)
-        print(proc.stderr, file=sys.stderr)
-        raise SystemExit(proc.returncode)
+    # Run as module from project root to maintain package context. Joining
+    # path parts is separator-agnostic and only strips the trailing suffix,
+    # unlike replace('.py', '') which would mangle a '.py' mid-path.
+    module_path = ".".join(path.relative_to(ROOT).with_suffix("").parts)
+    # Stream the child's output into a bounded tail instead of buffering it
+    # whole: long-running examples emit a JSON log line per message, and
+    # capture_output held all of it in memory until exit. Only the tail is
+    # useful when diagnosing a failure anyway.
+    tail: deque[str] = deque(maxlen=500)
+    proc = subprocess.Popen(
+        [sys.executable, "-m", module_path],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    assert proc.stdout is not None
+    for line in proc.stdout:
+        tail.append(line)
+    returncode = proc.wait()
+    return path, returncode, tail
 
 
 def test_all_examples() -> None:
-    """Pytest entry: executes each example's main.py if present."""
-    for entry in discover_example_entrypoints():
-        run_entrypoint(entry)
+    """Pytest entry: executes every example's main.py concurrently.
+
+    Each example costs interpreter startup plus its own sleeps/timeouts, so
+    the serial version's wall time was the sum over all examples; with the
+    subprocess fanout it is roughly the slowest example.
+    """
+    entrypoints = discover_example_entrypoints()
+    max_workers = max(1, (os.cpu_count() or 2) - 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(run_entrypoint, entrypoints))
+
+    failures = 0
+    for path, returncode, tail in results:
+        if returncode != 0:
+            failures += 1
+            print(f"[examples] FAILED ({returncode}): {path}")
+            sys.stderr.writelines(tail)
+    if failures:
+        raise SystemExit(1)
 
 
 if __name__ == "__main__":
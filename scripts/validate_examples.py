@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -16,19 +17,23 @@ class ExampleValidationResult:
 
 
 def validate_example_dir(example_dir: Path) -> ExampleValidationResult:
+    # One readdir answers both probes; per-file exists() would stat twice.
+    with os.scandir(example_dir) as it:
+        names = {entry.name for entry in it if entry.is_file()}
     return ExampleValidationResult(
         path=str(example_dir.relative_to(ROOT)),
-        has_readme=(example_dir / "README.md").exists(),
-        has_main=(example_dir / "main.py").exists(),
+        has_readme="README.md" in names,
+        has_main="main.py" in names,
     )
 
 
 def main() -> None:
     results = []
     if EXAMPLES_DIR.exists():
-        for sub in EXAMPLES_DIR.iterdir():
-            if sub.is_dir():
-                results.append(validate_example_dir(sub).__dict__)
+        with os.scandir(EXAMPLES_DIR) as it:
+            for entry in it:
+                if entry.is_dir():
+                    results.append(validate_example_dir(Path(entry.path)).__dict__)
     print(json.dumps({"results": results}, indent=2))
 
 